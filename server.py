@@ -1,21 +1,25 @@
 #!/usr/bin/env python3
 import asyncio
+import functools
+import heapq
 import re
+import shutil
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Optional, Set
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 from pathlib import Path
-import json
 import threading
-import time
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field, validator
-import uvicorn
+from pydantic import BaseModel, ConfigDict, Field
+import orjson
+from watchfiles import awatch
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,10 +35,24 @@ app.mount("/assets", StaticFiles(directory="assets"), name="assets")
 # Check if running in test mode via query parameter or environment variable
 import os
 TEST_MODE = os.environ.get("TEST_MODE", "false").lower() == "true"
-TODO_FILE = Path("todos.test.md") if TEST_MODE else Path("todos.md")
+PROD_TODO_FILE = Path("todos.md")
+TEST_TODO_FILE = Path(os.environ.get("TEST_TODO_FILE", "todos.test.md"))
+TODO_FILE = TEST_TODO_FILE if TEST_MODE else PROD_TODO_FILE
 BACKUP_DIR = Path("backups")
 
+SECTION_NAMES = ("today", "ideas", "backlog")
+_SECTION_HEADER_RE = re.compile(r'#\s+(\S.*?)\s*$')
+
+# Markdown metadata tokens, matched in a single pass; the group name is the task field
+_METADATA_RE = re.compile(
+    r'@(?P<category>\w+)|!(?P<effort>\d+[mhd])|%(?P<friction>\d)'
+    r'|\^(?P<due_date>\d{4}-\d{2}-\d{2})|\{(?P<completed_at>[^}]+)\}'
+)
+
 class Task(BaseModel):
+    # Documents the task shape; endpoints pass plain dicts, so skip building validators until first use
+    model_config = ConfigDict(defer_build=True)
+    
     id: str
     title: str
     is_idea: bool = False
@@ -49,19 +67,19 @@ class Task(BaseModel):
     depth: int = 0
     time_spent: int = 0  # Direct time in minutes
     total_time_spent: int = 0  # Including all descendants
-    
-Task.model_rebuild()
 
-class EnergyState(BaseModel):
-    current_energy: int = Field(ge=0, le=12, default=12)
-    max_energy: int = Field(default=12)
-    is_on_break: bool = Field(default=False)
+@dataclass
+class EnergyState:
+    # Plain dataclass: mutated on every energy call and regeneration tick, and never validated from input
+    current_energy: int = 12
+    max_energy: int = 12
+    is_on_break: bool = False
     break_end_time: Optional[datetime] = None
     last_reset_date: Optional[date] = None
-    session_id: str = Field(default="default")
+    session_id: str = "default"
     # Regeneration fields
-    last_regeneration_time: datetime = Field(default_factory=datetime.now)
-    is_regenerating: bool = Field(default=True)
+    last_regeneration_time: datetime = field(default_factory=datetime.now)
+    is_regenerating: bool = True
     regeneration_paused_at: Optional[datetime] = None
 
 class ConsumeEnergyRequest(BaseModel):
@@ -82,38 +100,105 @@ class RegenerationState(BaseModel):
 # Constants
 REGENERATION_INTERVAL = 15 * 60  # 15 minutes in seconds
 REGENERATION_AMOUNT = 1  # Energy points regenerated per interval
+EFFORT_UNIT_MINUTES = {"m": 1, "h": 60, "d": 8 * 60}  # A day of effort is one 8h workday
+MAX_ENERGY_SESSIONS = 10000  # Least recently used sessions are evicted beyond this
+OUTBOX_MAX_SIZE = 64  # Queued messages per WebSocket client before it is dropped
+CLOSE_TIMEOUT = 5  # Seconds to wait for a dropped client's close frame to be sent
+
+# Bumped by every save, so a save that keeps the file's mtime tick and size still changes the cache key
+_data_generation = 0
+
+# Last parsed markdown as a (key, sections) pair, keyed by (file, mtime, size, generation) so
+# unchanged files are not reparsed. Worker threads read and replace the pair in one assignment.
+_parse_cache: Tuple[Optional[tuple], Dict[str, List[Dict]]] = (None, {})
 
-# In-memory energy storage per session
-energy_storage: Dict[str, EnergyState] = {}
-regeneration_locks: Dict[str, threading.Lock] = {}  # Thread locks for safe regeneration updates
+# Aggregates derived from the parsed sections as (key, value) pairs, keyed like the parse cache
+_stats_cache: Tuple[Optional[tuple], Dict] = (None, {})
+_quick_win_cache: Tuple[Optional[tuple], Optional[Dict]] = (None, None)
+
+todo_file_lock = threading.Lock()  # Guards writes to TODO_FILE from worker threads
+
+# mtime of our own last save, so the file watcher doesn't rebroadcast it
+_last_written_mtime_ns: Optional[int] = None
+
+# In-memory energy storage per session, least recently used first
+energy_storage: OrderedDict[str, EnergyState] = OrderedDict()
+
+# Pending regenerations as a min-heap of (due time, session id). Entries whose due time no
+# longer matches regeneration_due[session_id] are stale and dropped when popped.
+regeneration_heap: List[Tuple[datetime, str]] = []
+regeneration_due: Dict[str, datetime] = {}
+regeneration_wakeup: Optional[asyncio.Event] = None  # Created on startup, inside the event loop
 
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
+        self.outboxes: Dict[WebSocket, asyncio.Queue] = {}
+        self.relay_tasks: Dict[WebSocket, asyncio.Task] = {}
+        self.close_tasks: Set[asyncio.Task] = set()  # Referenced until done so they aren't garbage collected
 
     async def connect(self, websocket: WebSocket):
+        # No socket tuning needed: asyncio/uvloop transports already set TCP_NODELAY
         await websocket.accept()
         self.active_connections.add(websocket)
+        self.outboxes[websocket] = asyncio.Queue(maxsize=OUTBOX_MAX_SIZE)
+        self.relay_tasks[websocket] = asyncio.create_task(self.relay(websocket))
 
     def disconnect(self, websocket: WebSocket):
         self.active_connections.discard(websocket)
+        self.outboxes.pop(websocket, None)
+        relay_task = self.relay_tasks.pop(websocket, None)
+        if relay_task and relay_task is not asyncio.current_task():
+            relay_task.cancel()
+
+    async def relay(self, websocket: WebSocket):
+        """Drain one client's outbox so a slow client never blocks broadcasts"""
+        outbox = self.outboxes[websocket]
+        try:
+            while True:
+                message = await outbox.get()
+                await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+        self.disconnect(websocket)
 
     async def broadcast(self, message: dict):
-        disconnected = set()
+        # Serialize once; every outbox shares the same encoded payload
+        payload = orjson.dumps(message).decode()
+        overflowed = []
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
-            except:
-                disconnected.add(connection)
-        self.active_connections -= disconnected
+                self.outboxes[connection].put_nowait(payload)
+            except asyncio.QueueFull:
+                overflowed.append(connection)
+        for connection in overflowed:
+            # Cancel the relay even if it is stuck in send_text, then close in the background;
+            # closing makes the client reconnect and refetch
+            self.disconnect(connection)
+            close_task = asyncio.create_task(self.close(connection))
+            self.close_tasks.add(close_task)
+            close_task.add_done_callback(self.close_tasks.discard)
+
+    async def close(self, websocket: WebSocket):
+        """Close a dropped client, giving up if the close frame can't be sent in time"""
+        try:
+            await asyncio.wait_for(websocket.close(), timeout=CLOSE_TIMEOUT)
+        except Exception:
+            pass
 
 manager = ConnectionManager()
 
 def get_or_create_energy_state(session_id: str = "default") -> EnergyState:
     """Get or create energy state for a session"""
-    if session_id not in energy_storage:
+    if session_id in energy_storage:
+        energy_storage.move_to_end(session_id)
+    else:
         energy_storage[session_id] = EnergyState(session_id=session_id)
-        regeneration_locks[session_id] = threading.Lock()
+        if len(energy_storage) > MAX_ENERGY_SESSIONS:
+            evicted_session_id, _ = energy_storage.popitem(last=False)
+            regeneration_due.pop(evicted_session_id, None)
     
     # Check for daily reset
     state = energy_storage[session_id]
@@ -126,13 +211,27 @@ def get_or_create_energy_state(session_id: str = "default") -> EnergyState:
         state.last_regeneration_time = datetime.now()
         state.is_regenerating = True
         state.regeneration_paused_at = None
+        schedule_regeneration(state)
     
     return state
 
+def schedule_regeneration(state: EnergyState):
+    """Queue the session's next regeneration if it is currently regenerating"""
+    if (not state.is_regenerating or state.regeneration_paused_at or
+            state.is_on_break or state.current_energy >= state.max_energy):
+        return
+    
+    due = state.last_regeneration_time + timedelta(seconds=REGENERATION_INTERVAL)
+    if regeneration_due.get(state.session_id) == due:
+        return
+    
+    regeneration_due[state.session_id] = due
+    heapq.heappush(regeneration_heap, (due, state.session_id))
+    if regeneration_wakeup:
+        regeneration_wakeup.set()
+
 def calculate_regeneration_state(state: EnergyState) -> RegenerationState:
     """Calculate current regeneration state"""
-    now = datetime.now()
-    
     # Regeneration is paused if: on break, at max energy, or manually paused
     if state.is_on_break or state.current_energy >= state.max_energy or not state.is_regenerating:
         return RegenerationState(
@@ -146,7 +245,7 @@ def calculate_regeneration_state(state: EnergyState) -> RegenerationState:
         # If paused, use the pause time instead of current time
         elapsed = (state.regeneration_paused_at - state.last_regeneration_time).total_seconds()
     else:
-        elapsed = (now - state.last_regeneration_time).total_seconds()
+        elapsed = (datetime.now() - state.last_regeneration_time).total_seconds()
     
     # Calculate remaining time until next regeneration
     time_remaining = max(0, REGENERATION_INTERVAL - elapsed)
@@ -171,14 +270,10 @@ def calculate_energy_cost(task_metadata: Dict) -> int:
         raise ValueError("Task friction is required to calculate energy cost")
     
     # Parse effort to minutes
-    if effort.endswith('m'):
-        minutes = int(effort[:-1])
-    elif effort.endswith('h'):
-        minutes = int(effort[:-1]) * 60
-    elif effort.endswith('d'):
-        minutes = int(effort[:-1]) * 8 * 60
-    else:
+    unit_minutes = EFFORT_UNIT_MINUTES.get(effort[-1])
+    if unit_minutes is None:
         raise ValueError(f"Invalid effort format: {effort}")
+    minutes = int(effort[:-1]) * unit_minutes
     
     # Calculate energy cost: base 1 energy per 30 minutes, scaled by friction
     base_cost = max(1, minutes // 30)
@@ -186,14 +281,8 @@ def calculate_energy_cost(task_metadata: Dict) -> int:
     
     return energy_cost
 
-def parse_markdown_line(line: str, line_num: int, parent_id: Optional[str] = None, depth: int = 0) -> Optional[Dict]:
-    """Parse a single markdown line into a task object"""
-    indent_level = (len(line) - len(line.lstrip())) // 2
-    line = line.strip()
-    
-    if not line.startswith("- ["):
-        return None
-        
+def parse_markdown_line(line: str, line_num: int, parent_id: Optional[str] = None, depth: int = 0) -> Dict:
+    """Parse a single task line, already stripped of indentation, into a task object"""
     is_completed = line[3] == "x"
     content = line[5:].strip()
     
@@ -201,26 +290,24 @@ def parse_markdown_line(line: str, line_num: int, parent_id: Optional[str] = Non
     if is_idea:
         content = content[1:].strip()
     
-    # Extract metadata
-    category_match = re.search(r'@(\w+)', content)
-    category = category_match.group(1) if category_match else None
-    
-    effort_match = re.search(r'!(\d+[mhd])', content)
-    effort = effort_match.group(1) if effort_match else None
-    
-    friction_match = re.search(r'%(\d)', content)
-    friction = int(friction_match.group(1)) if friction_match else None
-    
-    due_match = re.search(r'\^(\d{4}-\d{2}-\d{2})', content)
-    due_date = due_match.group(1) if due_match else None
-    
-    completed_match = re.search(r'\{([^}]+)\}', content)
-    completed_at = completed_match.group(1) if completed_match else None
-    
-    # Remove metadata from title
-    title = content
-    for pattern in [r'@\w+', r'!\d+[mhd]', r'%\d', r'\^\d{4}-\d{2}-\d{2}', r'\{[^}]+\}']:
-        title = re.sub(pattern, '', title).strip()
+    # Extract metadata and strip it from the title in one scan
+    metadata = {}
+    title_parts = []
+    pos = 0
+    for match in _METADATA_RE.finditer(content):
+        title_parts.append(content[pos:match.start()])
+        pos = match.end()
+        kind = match.lastgroup
+        if kind not in metadata:
+            metadata[kind] = match.group(kind)
+    title_parts.append(content[pos:])
+    title = "".join(title_parts).strip()
+    
+    category = metadata.get("category")
+    effort = metadata.get("effort")
+    friction = int(metadata["friction"]) if "friction" in metadata else None
+    due_date = metadata.get("due_date")
+    completed_at = metadata.get("completed_at")
     
     return {
         "id": f"task_{line_num}",
@@ -232,7 +319,6 @@ def parse_markdown_line(line: str, line_num: int, parent_id: Optional[str] = Non
         "friction": friction,
         "due_date": due_date,
         "completed_at": completed_at,
-        "indent_level": indent_level,
         "parent_id": parent_id,
         "depth": depth,
         "time_spent": 0,
@@ -240,27 +326,53 @@ def parse_markdown_line(line: str, line_num: int, parent_id: Optional[str] = Non
         "subtasks": []
     }
 
-def parse_markdown() -> Dict[str, List[Task]]:
-    """Parse the markdown file into structured data"""
+def parse_markdown() -> Dict[str, List[Dict]]:
+    """Parse the markdown file into structured data, reusing the cached result while the file is unchanged.
+    The returned tree is shared with the cache and read-only; copy it before mutating."""
+    _, sections = load_sections()
+    return sections
+
+def load_sections() -> Tuple[tuple, Dict[str, List[Dict]]]:
+    """Return the parse cache key and the shared parsed sections, which callers must not mutate"""
+    global _parse_cache
     if not TODO_FILE.exists():
         TODO_FILE.write_text("# today\n\n# ideas\n\n# backlog\n")
-        return {"today": [], "ideas": [], "backlog": []}
     
-    content = TODO_FILE.read_text()
-    sections = {"today": [], "ideas": [], "backlog": []}
+    # Read the generation first: a save landing mid-parse then always forces a reparse next time
+    generation = _data_generation
+    stat = TODO_FILE.stat()
+    cache_key = (TODO_FILE, stat.st_mtime_ns, stat.st_size, generation)
+    cached_key, sections = _parse_cache
+    if cache_key != cached_key:
+        with TODO_FILE.open() as f:
+            sections = parse_markdown_lines(f)
+        _parse_cache = (cache_key, sections)
+    
+    return cache_key, sections
+
+def parse_markdown_lines(lines: Iterable[str]) -> Dict[str, List[Dict]]:
+    """Parse markdown lines (e.g. a file streamed line by line) into structured data"""
+    sections = {name: [] for name in SECTION_NAMES}
     current_section = None
     task_stack = []
     
-    for line_num, line in enumerate(content.split('\n')):
-        if line.strip().startswith("# "):
-            current_section = line.strip()[2:].lower()
-            task_stack = []
+    for line_num, line in enumerate(lines):
+        stripped = line.lstrip()
+        if not stripped:
             continue
+        
+        if stripped[0] == "#":
+            header = _SECTION_HEADER_RE.match(stripped)
+            if header:
+                # Tasks under unknown sections are skipped
+                name = header.group(1).lower()
+                current_section = name if name in SECTION_NAMES else None
+                task_stack = []
+                continue
             
-        if current_section and line.strip().startswith("- ["):
+        if current_section and stripped.startswith("- ["):
             # Calculate depth based on indentation level
-            indent_level = (len(line) - len(line.lstrip())) // 2
-            depth = indent_level
+            indent_level = (len(line) - len(stripped)) // 2
             
             # Find parent task based on indent level
             while len(task_stack) > indent_level:
@@ -268,22 +380,20 @@ def parse_markdown() -> Dict[str, List[Task]]:
             
             parent_id = task_stack[-1]["id"] if task_stack else None
             
-            task_data = parse_markdown_line(line, line_num, parent_id, depth)
-            if task_data:
-                actual_indent = task_data.pop("indent_level")
-                
-                if indent_level > 0 and task_stack:
-                    parent = task_stack[-1]
-                    task_data["parent_id"] = parent["id"]
-                    parent["subtasks"].append(task_data)
-                    # Inherit category from parent if not specified
-                    if not task_data["category"] and parent.get("category"):
-                        task_data["category"] = parent["category"]
-                else:
-                    sections[current_section].append(task_data)
-                
-                if indent_level == len(task_stack):
-                    task_stack.append(task_data)
+            task_data = parse_markdown_line(stripped, line_num, parent_id, indent_level)
+            
+            if indent_level > 0 and task_stack:
+                parent = task_stack[-1]
+                task_data["parent_id"] = parent["id"]
+                parent["subtasks"].append(task_data)
+                # Inherit category from parent if not specified
+                if not task_data["category"] and parent.get("category"):
+                    task_data["category"] = parent["category"]
+            else:
+                sections[current_section].append(task_data)
+            
+            if indent_level == len(task_stack):
+                task_stack.append(task_data)
     
     # Calculate total time spent for all tasks
     for section_tasks in sections.values():
@@ -292,76 +402,99 @@ def parse_markdown() -> Dict[str, List[Task]]:
     
     return sections
 
-def task_to_markdown(task: Dict, indent: int = 0) -> str:
-    """Convert a task object back to markdown format"""
-    prefix = "  " * indent + "- "
-    check = "[x]" if task.get("is_completed") else "[ ]"
-    
-    parts = [prefix, check, " "]
-    
-    if task.get("is_idea"):
-        parts.append("? ")
-    
-    parts.append(task["title"])
-    
-    if task.get("category"):
-        parts.append(f" @{task['category']}")
-    
-    if task.get("effort"):
-        parts.append(f" !{task['effort']}")
-    
-    if task.get("friction"):
-        parts.append(f" %{task['friction']}")
-    
-    if task.get("due_date"):
-        parts.append(f" ^{task['due_date']}")
-    
-    if task.get("completed_at"):
-        parts.append(f" {{{task['completed_at']}}}")
-    
-    lines = ["".join(parts)]
-    
-    for subtask in task.get("subtasks", []):
-        lines.append(task_to_markdown(subtask, indent + 1))
-    
-    return "\n".join(lines)
+def task_to_markdown(task: Dict, indent: int, out: List[str]) -> None:
+    """Append a task and its subtasks to out as newline-terminated markdown chunks"""
+    stack = [(task, indent)]
+    while stack:
+        task, indent = stack.pop()
+        out.append("  " * indent)
+        out.append("- [x] " if task.get("is_completed") else "- [ ] ")
+        
+        if task.get("is_idea"):
+            out.append("? ")
+        
+        out.append(task["title"])
+        
+        if task.get("category"):
+            out.append(f" @{task['category']}")
+        
+        if task.get("effort"):
+            out.append(f" !{task['effort']}")
+        
+        if task.get("friction"):
+            out.append(f" %{task['friction']}")
+        
+        if task.get("due_date"):
+            out.append(f" ^{task['due_date']}")
+        
+        if task.get("completed_at"):
+            out.append(f" {{{task['completed_at']}}}")
+        
+        out.append("\n")
+        
+        # Reversed so subtasks pop in document order
+        stack.extend((subtask, indent + 1) for subtask in reversed(task.get("subtasks", [])))
 
 def calculate_total_time(task: Dict) -> int:
     """Calculate total time spent including all descendants"""
-    total = task.get("time_spent", 0)
-    for subtask in task.get("subtasks", []):
-        total += calculate_total_time(subtask)
-    task["total_time_spent"] = total
-    return total
+    # Pre-order list of the subtree; walking it backwards visits children before parents
+    ordered = []
+    stack = [task]
+    while stack:
+        node = stack.pop()
+        ordered.append(node)
+        stack.extend(node.get("subtasks", []))
+    
+    for node in reversed(ordered):
+        total = node.get("time_spent", 0)
+        for subtask in node.get("subtasks", []):
+            total += subtask["total_time_spent"]
+        node["total_time_spent"] = total
+    
+    return task["total_time_spent"]
 
 def save_markdown(sections: Dict[str, List[Dict]]):
     """Save the structured data back to markdown"""
+    global _last_written_mtime_ns
     # Calculate total time for all tasks before saving
     for section_tasks in sections.values():
         for task in section_tasks:
             calculate_total_time(task)
     
-    # Create backup
-    if TODO_FILE.exists():
-        BACKUP_DIR.mkdir(exist_ok=True)
-        backup_name = datetime.now().strftime("todos_%Y%m%d_%H%M%S.md")
-        (BACKUP_DIR / backup_name).write_text(TODO_FILE.read_text())
-    
-    lines = []
+    out = []
     for section_name, tasks in sections.items():
-        lines.append(f"# {section_name}")
+        if out:
+            out.append("\n")
+        out.append(f"# {section_name}\n")
         for task in tasks:
-            lines.append(task_to_markdown(task))
-        lines.append("")
-    
-    TODO_FILE.write_text("\n".join(lines))
+            task_to_markdown(task, 0, out)
+    
+    # Saves run in worker threads; serialize backup + write so they don't interleave
+    with todo_file_lock:
+        # Create backup
+        if TODO_FILE.exists():
+            BACKUP_DIR.mkdir(exist_ok=True)
+            backup_name = datetime.now().strftime("todos_%Y%m%d_%H%M%S.md")
+            shutil.copy2(TODO_FILE, BACKUP_DIR / backup_name)
+        
+        # Write a sibling file and swap it in, so concurrent unlocked reads never see a partial file
+        temp_file = TODO_FILE.with_name(f".{TODO_FILE.name}.tmp")
+        temp_file.write_text("".join(out))
+        os.replace(temp_file, TODO_FILE)
+        _last_written_mtime_ns = TODO_FILE.stat().st_mtime_ns
+        invalidate_parse_cache()
+
+def invalidate_parse_cache():
+    """Force the next load_sections call to reread the file, and the stats and quick win to recompute"""
+    global _data_generation
+    _data_generation += 1
 
 @app.get("/")
 async def root(test: bool = False):
     global TEST_MODE, TODO_FILE
     if test:
         TEST_MODE = True
-        TODO_FILE = Path("todos.test.md")
+        TODO_FILE = TEST_TODO_FILE
     return FileResponse("index.html")
 
 @app.get("/api/test-mode")
@@ -370,27 +503,32 @@ async def get_test_mode():
 
 @app.get("/api/todos")
 async def get_todos():
-    return parse_markdown()
+    return await asyncio.to_thread(parse_markdown)
 
 @app.post("/api/todos")
 async def update_todos(sections: Dict[str, List[Dict]]):
-    save_markdown(sections)
+    # Broadcast only once the new file is in place, so clients refetching on update read it
+    await asyncio.to_thread(save_markdown, sections)
     await manager.broadcast({"type": "update", "data": sections})
     return {"status": "ok"}
 
 @app.get("/api/stats")
 async def get_stats():
-    sections = parse_markdown()
-    
-    def count_tasks(tasks):
-        total = len(tasks)
-        completed = sum(1 for t in tasks if t.get("is_completed"))
-        for task in tasks:
-            sub_total, sub_completed = count_tasks(task.get("subtasks", []))
-            total += sub_total
-            completed += sub_completed
-        return total, completed
-    
+    return await asyncio.to_thread(get_cached_stats)
+
+def get_cached_stats() -> Dict:
+    """Stats for the current file contents, recomputed only when the file or the date changes; shared and read-only"""
+    global _stats_cache
+    cache_key, sections = load_sections()
+    stats_key = (cache_key, date.today().isoformat())
+    cached_key, stats = _stats_cache
+    if stats_key != cached_key:
+        stats = calculate_stats(sections, stats_key[1])
+        _stats_cache = (stats_key, stats)
+    return stats
+
+def calculate_stats(sections: Dict[str, List[Dict]], today: str) -> Dict:
+    """Aggregate task counts, categories and XP over all sections"""
     stats = {
         "categories": {},
         "total_tasks": 0,
@@ -399,49 +537,32 @@ async def get_stats():
         "total_xp": 0,
         "streak": 0
     }
+    categories = stats["categories"]
     
-    # Count by category
+    # Single pre-order walk collecting counts, categories and XP
     for section_tasks in sections.values():
-        total, completed = count_tasks(section_tasks)
-        stats["total_tasks"] += total
-        
-        def collect_categories(tasks):
-            for task in tasks:
-                if task.get("category") and not task.get("is_idea"):
-                    cat = task["category"]
-                    if cat not in stats["categories"]:
-                        stats["categories"][cat] = {"total": 0, "completed": 0}
-                    stats["categories"][cat]["total"] += 1
-                    if task.get("is_completed"):
-                        stats["categories"][cat]["completed"] += 1
-                collect_categories(task.get("subtasks", []))
-        
-        collect_categories(section_tasks)
-    
-    # Calculate completed today and XP
-    today = date.today().isoformat()
-    for section_tasks in sections.values():
-        def process_tasks(tasks):
-            count = 0
-            xp_today = 0
-            total_xp = 0
-            for task in tasks:
-                if task.get("is_completed"):
-                    task_xp = calculate_xp(task)
-                    total_xp += task_xp
-                    if task.get("completed_at") and task["completed_at"].startswith(today):
-                        count += 1
-                        xp_today += task_xp
-                sub_count, sub_xp_today, sub_total_xp = process_tasks(task.get("subtasks", []))
-                count += sub_count
-                xp_today += sub_xp_today
-                total_xp += sub_total_xp
-            return count, xp_today, total_xp
-        
-        count, xp_today, total_xp = process_tasks(section_tasks)
-        stats["completed_today"] += count
-        stats["xp_today"] += xp_today
-        stats["total_xp"] += total_xp
+        stack = list(reversed(section_tasks))
+        while stack:
+            task = stack.pop()
+            stats["total_tasks"] += 1
+            is_completed = task.get("is_completed")
+            
+            if is_completed:
+                task_xp = calculate_xp(task)
+                stats["total_xp"] += task_xp
+                completed_at = task.get("completed_at")
+                if completed_at and completed_at[:10] == today:
+                    stats["completed_today"] += 1
+                    stats["xp_today"] += task_xp
+            
+            cat = task.get("category")
+            if cat and not task.get("is_idea"):
+                cat_stats = categories.setdefault(cat, {"total": 0, "completed": 0})
+                cat_stats["total"] += 1
+                if is_completed:
+                    cat_stats["completed"] += 1
+            
+            stack.extend(reversed(task.get("subtasks", [])))
     
     return stats
 
@@ -461,60 +582,73 @@ async def add_bonus_xp(data: BonusXP):
 
 @app.get("/api/quick-win")
 async def get_quick_win():
-    sections = parse_markdown()
-    
-    # Find low-effort incomplete tasks
-    candidates = []
-    
-    def collect_candidates(tasks):
-        for task in tasks:
-            if not task.get("is_completed") and not task.get("is_idea"):
-                effort = task.get("effort", "30m")
-                effort_minutes = 30
-                if effort:
-                    if effort.endswith("m"):
-                        effort_minutes = int(effort[:-1])
-                    elif effort.endswith("h"):
-                        effort_minutes = int(effort[:-1]) * 60
-                
-                if effort_minutes <= 30:
-                    candidates.append({
-                        **task,
-                        "effort_minutes": effort_minutes,
-                        "xp": calculate_xp(task)
-                    })
-            
-            collect_candidates(task.get("subtasks", []))
-    
+    return await asyncio.to_thread(get_cached_quick_win)
+
+def get_cached_quick_win() -> Optional[Dict]:
+    """Quick win for the current file contents, recomputed only when the file changes; shared and read-only"""
+    global _quick_win_cache
+    cache_key, sections = load_sections()
+    cached_key, quick_win = _quick_win_cache
+    if cache_key != cached_key:
+        quick_win = find_quick_win(sections)
+        _quick_win_cache = (cache_key, quick_win)
+    return quick_win
+
+def find_quick_win(sections: Dict[str, List[Dict]]) -> Optional[Dict]:
+    """Find the lowest-effort, highest-XP incomplete task"""
+    # One pre-order scan; ties keep the first task in file order
+    best = None
+    best_key = None
     for section_tasks in sections.values():
-        collect_candidates(section_tasks)
-    
-    # Sort by effort (ascending) and XP (descending)
-    candidates.sort(key=lambda x: (x["effort_minutes"], -x["xp"]))
+        stack = list(reversed(section_tasks))
+        while stack:
+            task = stack.pop()
+            stack.extend(reversed(task.get("subtasks", [])))
+            if task.get("is_completed") or task.get("is_idea"):
+                continue
+            
+            effort_minutes = effort_to_minutes(task.get("effort", "30m"))
+            if effort_minutes > 30:
+                continue
+            
+            xp = calculate_xp(task)
+            key = (effort_minutes, -xp)
+            if best_key is None or key < best_key:
+                best_key = key
+                best = {**task, "effort_minutes": effort_minutes, "xp": xp}
     
-    return candidates[0] if candidates else None
+    return best
+
+@functools.lru_cache(maxsize=256)
+def effort_to_minutes(effort: Optional[str]) -> int:
+    """Convert an effort string like 15m, 2h or 1d to minutes, defaulting to 30"""
+    if effort:
+        unit_minutes = EFFORT_UNIT_MINUTES.get(effort[-1])
+        if unit_minutes:
+            return int(effort[:-1]) * unit_minutes
+    return 30
 
 def calculate_xp(task: Dict) -> int:
     """Calculate XP based on effort and friction"""
-    effort = task.get("effort", "30m")
-    minutes = 30
-    if effort:
-        if effort.endswith("m"):
-            minutes = int(effort[:-1])
-        elif effort.endswith("h"):
-            minutes = int(effort[:-1]) * 60
-        elif effort.endswith("d"):
-            minutes = int(effort[:-1]) * 8 * 60
-    
-    friction = task.get("friction") or 2
+    # Bonus for subtasks
+    subtasks = task.get("subtasks")
+    all_subtasks_done = False
+    if subtasks:
+        all_subtasks_done = True
+        for subtask in subtasks:
+            if not subtask.get("is_completed"):
+                all_subtasks_done = False
+                break
+    return _xp_for(task.get("effort", "30m"), task.get("friction") or 2, all_subtasks_done)
+
+@functools.lru_cache(maxsize=256)
+def _xp_for(effort: Optional[str], friction: int, all_subtasks_done: bool) -> int:
+    """XP for an effort/friction pair; tasks share few distinct values, so results are cached"""
+    minutes = effort_to_minutes(effort)
     base_xp = round(100 * (1 + minutes / 60) ** 0.5 * friction)
     
-    # Bonus for subtasks
-    if task.get("subtasks"):
-        completed_subtasks = sum(1 for st in task["subtasks"] if st.get("is_completed"))
-        total_subtasks = len(task["subtasks"])
-        if completed_subtasks == total_subtasks and total_subtasks > 0:
-            base_xp = int(base_xp * 1.5)
+    if all_subtasks_done:
+        base_xp = int(base_xp * 1.5)
     
     return base_xp
 
@@ -522,15 +656,17 @@ def calculate_xp(task: Dict) -> int:
 async def get_energy(session_id: str = "default"):
     """Get current energy state"""
     state = get_or_create_energy_state(session_id)
+    now = datetime.now()
     
     # Check if break is complete
-    if state.is_on_break and state.break_end_time and datetime.now() >= state.break_end_time:
+    if state.is_on_break and state.break_end_time and now >= state.break_end_time:
         # Restore energy
-        duration = (state.break_end_time - datetime.now()).total_seconds() / 60
+        duration = (state.break_end_time - now).total_seconds() / 60
         energy_restored = min(state.max_energy - state.current_energy, max(1, int(duration / 15)))
         state.current_energy = min(state.max_energy, state.current_energy + energy_restored)
         state.is_on_break = False
         state.break_end_time = None
+        schedule_regeneration(state)
         
         # Broadcast update
         await manager.broadcast({
@@ -564,6 +700,7 @@ async def consume_energy(request: ConsumeEnergyRequest, session_id: str = "defau
         )
     
     state.current_energy -= energy_cost
+    schedule_regeneration(state)
     
     # Don't automatically pause regeneration on consume
     # The frontend will call the pause endpoint when actually working
@@ -598,7 +735,8 @@ async def start_break(duration_minutes: int = 15, session_id: str = "default") -
     
     # Calculate break duration and energy restoration
     duration_minutes = max(5, min(60, duration_minutes))  # Between 5 and 60 minutes
-    break_end_time = datetime.now() + timedelta(minutes=duration_minutes)
+    now = datetime.now()
+    break_end_time = now + timedelta(minutes=duration_minutes)
     
     # Energy restored: 1 point per 15 minutes of break
     energy_to_restore = min(
@@ -611,13 +749,13 @@ async def start_break(duration_minutes: int = 15, session_id: str = "default") -
     
     # Pause regeneration during break
     if state.is_regenerating and state.regeneration_paused_at is None:
-        state.regeneration_paused_at = datetime.now()
+        state.regeneration_paused_at = now
     
     # Broadcast break started
     await manager.broadcast({
         "type": "break_started",
         "data": {
-            "break_end_time": break_end_time.isoformat(),
+            "break_end_time": break_end_time,
             "duration_minutes": duration_minutes,
             "energy_to_restore": energy_to_restore
         }
@@ -641,7 +779,8 @@ async def complete_break(session_id: str = "default"):
         raise HTTPException(status_code=400, detail="No break end time set")
     
     # Calculate energy to restore based on actual break duration
-    actual_duration = (datetime.now() - (state.break_end_time - timedelta(minutes=15))).total_seconds() / 60
+    now = datetime.now()
+    actual_duration = (now - (state.break_end_time - timedelta(minutes=15))).total_seconds() / 60
     energy_restored = min(
         state.max_energy - state.current_energy,
         max(1, int(actual_duration / 15))
@@ -655,7 +794,8 @@ async def complete_break(session_id: str = "default"):
     if state.current_energy < state.max_energy:
         state.is_regenerating = True
         state.regeneration_paused_at = None
-        state.last_regeneration_time = datetime.now()
+        state.last_regeneration_time = now
+        schedule_regeneration(state)
     
     # Broadcast energy restored
     await manager.broadcast({
@@ -695,7 +835,7 @@ async def pause_regeneration(session_id: str = "default"):
             "data": {
                 "regeneration_time_remaining": regen_state.regeneration_time_remaining,
                 "is_regenerating": regen_state.is_regenerating,
-                "last_regeneration_time": regen_state.last_regeneration_time.isoformat()
+                "last_regeneration_time": regen_state.last_regeneration_time
             }
         })
     
@@ -715,6 +855,7 @@ async def resume_regeneration(session_id: str = "default"):
         state.last_regeneration_time = state.last_regeneration_time + timedelta(seconds=pause_duration)
         state.regeneration_paused_at = None
         state.is_regenerating = True
+        schedule_regeneration(state)
         
         # Broadcast regeneration resumed
         regen_state = calculate_regeneration_state(state)
@@ -723,7 +864,7 @@ async def resume_regeneration(session_id: str = "default"):
             "data": {
                 "regeneration_time_remaining": regen_state.regeneration_time_remaining,
                 "is_regenerating": regen_state.is_regenerating,
-                "last_regeneration_time": regen_state.last_regeneration_time.isoformat()
+                "last_regeneration_time": regen_state.last_regeneration_time
             }
         })
     
@@ -740,67 +881,91 @@ async def websocket_endpoint(websocket: WebSocket):
 
 # File watcher for auto-reload
 async def watch_file():
-    last_mtime = 0
-    while True:
+    """Notify clients whenever the todo file changes on disk"""
+    # TODO_FILE can switch to the test file at runtime (?test=true), so watch both and
+    # compare each batch against whichever one is in use now
+    data_files = {PROD_TODO_FILE.resolve(), TEST_TODO_FILE.resolve()}
+    async for changes in awatch(*{data_file.parent for data_file in data_files}, recursive=False):
+        current_file = TODO_FILE.resolve()
+        if not any(Path(path).resolve() == current_file for _, path in changes):
+            continue
         try:
-            if TODO_FILE.exists():
-                mtime = TODO_FILE.stat().st_mtime
-                if mtime > last_mtime:
-                    last_mtime = mtime
-                    sections = parse_markdown()
-                    await manager.broadcast({"type": "file_changed", "data": sections})
+            # Saves through the API were already broadcast by update_todos
+            mtime_ns = TODO_FILE.stat().st_mtime_ns
+            if mtime_ns != _last_written_mtime_ns:
+                # Clients refetch /api/todos, which parses at most once per change via the cache
+                await manager.broadcast({"type": "file_changed", "mtime": mtime_ns})
+        except FileNotFoundError:
+            continue
         except Exception as e:
             print(f"Watch error: {e}")
-        await asyncio.sleep(1)
 
 # Background task for automatic energy regeneration
 async def regeneration_task():
-    """Background task that checks for energy regeneration every second"""
+    """Background task that sleeps until the earliest scheduled regeneration is due"""
+    global regeneration_wakeup
+    regeneration_wakeup = asyncio.Event()
+    for state in energy_storage.values():
+        schedule_regeneration(state)
+    
     while True:
         try:
-            # Check all sessions for regeneration
-            for session_id, state in list(energy_storage.items()):
-                if not state.is_regenerating or state.regeneration_paused_at:
-                    continue
+            # Sleep until the next regeneration is due or a new one is scheduled
+            regeneration_wakeup.clear()
+            if not regeneration_heap:
+                await regeneration_wakeup.wait()
+                continue
+            due, session_id = regeneration_heap[0]
+            now = datetime.now()
+            delay = (due - now).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(regeneration_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            heapq.heappop(regeneration_heap)
+            if regeneration_due.get(session_id) != due:
+                continue  # Superseded by a later schedule_regeneration call
+            del regeneration_due[session_id]
+            
+            state = energy_storage.get(session_id)
+            if state is None:
+                continue
+            
+            # Runs on the event loop with no await until the broadcast, so the check and update are atomic
+            elapsed = (now - state.last_regeneration_time).total_seconds()
+            if (elapsed >= REGENERATION_INTERVAL and
+                state.current_energy < state.max_energy and 
+                state.is_regenerating and 
+                not state.regeneration_paused_at and 
+                not state.is_on_break):
+                
+                # Regenerate energy
+                state.current_energy = min(state.max_energy, state.current_energy + REGENERATION_AMOUNT)
+                state.last_regeneration_time = now
                 
-                # Skip if on break or at max energy
-                if state.is_on_break or state.current_energy >= state.max_energy:
-                    continue
+                # If at max energy, stop regenerating
+                if state.current_energy >= state.max_energy:
+                    state.is_regenerating = False
                 
-                # Check if it's time to regenerate
-                elapsed = (datetime.now() - state.last_regeneration_time).total_seconds()
-                if elapsed >= REGENERATION_INTERVAL:
-                    # Use lock to ensure thread safety
-                    with regeneration_locks.get(session_id, threading.Lock()):
-                        # Double-check conditions after acquiring lock
-                        if (state.current_energy < state.max_energy and 
-                            state.is_regenerating and 
-                            not state.regeneration_paused_at and 
-                            not state.is_on_break):
-                            
-                            # Regenerate energy
-                            state.current_energy = min(state.max_energy, state.current_energy + REGENERATION_AMOUNT)
-                            state.last_regeneration_time = datetime.now()
-                            
-                            # Broadcast regeneration
-                            await manager.broadcast({
-                                "type": "energy_regenerated",
-                                "data": {
-                                    "current_energy": state.current_energy,
-                                    "max_energy": state.max_energy,
-                                    "energy_regenerated": REGENERATION_AMOUNT,
-                                    "session_id": session_id
-                                }
-                            })
-                            
-                            # If at max energy, stop regenerating
-                            if state.current_energy >= state.max_energy:
-                                state.is_regenerating = False
+                # Broadcast regeneration
+                await manager.broadcast({
+                    "type": "energy_regenerated",
+                    "data": {
+                        "current_energy": state.current_energy,
+                        "max_energy": state.max_energy,
+                        "energy_regenerated": REGENERATION_AMOUNT,
+                        "session_id": session_id
+                    }
+                })
+            
+            schedule_regeneration(state)
         
         except Exception as e:
             print(f"Regeneration error: {e}")
-        
-        await asyncio.sleep(1)  # Check every second
+            await asyncio.sleep(1)
 
 # Store background tasks
 background_tasks = []
@@ -827,5 +992,8 @@ async def shutdown_event():
     print("✅ Background tasks stopped")
 
 if __name__ == "__main__":
+    # Only needed when run as a script; importing server (tests, `uvicorn server:app`) skips it
+    import uvicorn
+    
     # Run the server
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
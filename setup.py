@@ -7,14 +7,45 @@ import os
 import sys
 import subprocess
 import platform
+import shutil
 from pathlib import Path
 
+_IS_WINDOWS = platform.system() == "Windows"
+_BIN_DIR = "Scripts" if _IS_WINDOWS else "bin"
+_PIP_EXE = "pip.exe" if _IS_WINDOWS else "pip"
+_PYTHON_EXE = "python.exe" if _IS_WINDOWS else "python"
+
+_SAMPLE_TODOS = b"""# today
+- [ ] Welcome to Confetti Todo! @admin !5m %1
+- [ ] Try adding a new task with N @admin !5m %1
+- [ ] Complete this task for confetti! @admin !5m %1
+  - [ ] Click the checkbox
+  - [ ] Enjoy the celebration
+
+# ideas
+- [ ] ? Explore all the keyboard shortcuts
+- [ ] ? Customize categories for your workflow
+
+# backlog
+- [ ] Read the documentation @admin !30m %1
+"""
+
+# Cleared by --quiet; errors are always printed
+_VERBOSE = True
+
 def print_header(message, emoji=""):
     """Print a formatted header message"""
+    if not _VERBOSE:
+        return
     print(f"\n{emoji} {message}")
     if not emoji:
         print("-" * len(message))
 
+def print_status(message):
+    """Print a progress message unless running quietly"""
+    if _VERBOSE:
+        print(message)
+
 def check_python_version():
     """Check if Python version is 3.9 or higher"""
     print_header("Checking Python version...", "📌")
@@ -23,7 +54,7 @@ def check_python_version():
         print(f"❌ Error: Python 3.9 or higher is required (found {version.major}.{version.minor})")
         print("Please install Python 3.9+ from https://www.python.org/")
         sys.exit(1)
-    print(f"✅ Python {version.major}.{version.minor}.{version.micro} found")
+    print_status(f"✅ Python {version.major}.{version.minor}.{version.micro} found")
 
 def create_virtual_environment():
     """Create a virtual environment"""
@@ -31,52 +62,57 @@ def create_virtual_environment():
     venv_path = Path("venv")
     
     if venv_path.exists():
-        print("   Virtual environment already exists")
+        print_status("   Virtual environment already exists")
     else:
         subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
-        print("✅ Virtual environment created")
+        print_status("✅ Virtual environment created")
     
     return venv_path
 
 def get_pip_command(venv_path):
     """Get the pip command for the virtual environment"""
-    if platform.system() == "Windows":
-        return str(venv_path / "Scripts" / "pip.exe")
-    else:
-        return str(venv_path / "bin" / "pip")
+    return str(venv_path / _BIN_DIR / _PIP_EXE)
 
 def get_python_command(venv_path):
     """Get the python command for the virtual environment"""
-    if platform.system() == "Windows":
-        return str(venv_path / "Scripts" / "python.exe")
-    else:
-        return str(venv_path / "bin" / "python")
+    return str(venv_path / _BIN_DIR / _PYTHON_EXE)
 
 def install_dependencies(venv_path, dev=False):
     """Install project dependencies"""
-    pip_cmd = get_pip_command(venv_path)
+    python_cmd = get_python_command(venv_path)
+    uv_cmd = shutil.which("uv")
     
-    # Upgrade pip
-    print_header("Upgrading pip...", "📦")
-    subprocess.run([pip_cmd, "install", "--upgrade", "pip", "--quiet"], check=True)
-    print("✅ Pip upgraded")
+    if uv_cmd:
+        # uv downloads and installs in parallel, so there is no pip to upgrade
+        install_cmd = [uv_cmd, "pip", "install", "--python", python_cmd]
+        install_flags = ["--quiet"]
+    else:
+        pip_cmd = get_pip_command(venv_path)
+        
+        # Upgrade pip
+        print_header("Upgrading pip...", "📦")
+        subprocess.run([pip_cmd, "install", "--upgrade", "pip", "--quiet"], check=True)
+        print_status("✅ Pip upgraded")
+        
+        install_cmd = [pip_cmd, "install"]
+        # Prefer wheels so cached or prebuilt binaries win over building sdists
+        install_flags = ["--prefer-binary", "--quiet"]
     
-    # Install main dependencies
-    print_header("Installing dependencies...", "📦")
-    subprocess.run([pip_cmd, "install", "-r", "requirements.txt", "--quiet"], check=True)
-    print("✅ Dependencies installed")
+    # Install main (and dev, if requested) dependencies in one resolver pass
+    install_cmd += ["-r", "requirements.txt"]
+    if dev:
+        print_header("Installing dependencies and development dependencies...", "📦")
+        install_cmd += ["-r", "requirements-dev.txt"]
+    else:
+        print_header("Installing dependencies...", "📦")
+    subprocess.run(install_cmd + install_flags, check=True)
+    print_status("✅ Dependencies installed")
     
-    # Install dev dependencies if requested
     if dev:
-        print_header("Installing development dependencies...", "📦")
-        subprocess.run([pip_cmd, "install", "-r", "requirements-dev.txt", "--quiet"], check=True)
-        print("✅ Development dependencies installed")
-        
         # Install playwright browsers
         print_header("Installing Playwright browsers...", "🌐")
-        python_cmd = get_python_command(venv_path)
         subprocess.run([python_cmd, "-m", "playwright", "install", "chromium"], check=True)
-        print("✅ Playwright browsers installed")
+        print_status("✅ Playwright browsers installed")
 
 def create_sample_todos():
     """Create a sample todos.md file"""
@@ -84,59 +120,54 @@ def create_sample_todos():
     
     if not todos_path.exists():
         print_header("Creating sample todos.md...", "📝")
-        todos_content = """# today
-- [ ] Welcome to Confetti Todo! @admin !5m %1
-- [ ] Try adding a new task with N @admin !5m %1
-- [ ] Complete this task for confetti! @admin !5m %1
-  - [ ] Click the checkbox
-  - [ ] Enjoy the celebration
-
-# ideas
-- [ ] ? Explore all the keyboard shortcuts
-- [ ] ? Customize categories for your workflow
-
-# backlog
-- [ ] Read the documentation @admin !30m %1
-"""
-        todos_path.write_text(todos_content)
-        print("✅ Sample todos.md created")
+        todos_path.write_bytes(_SAMPLE_TODOS)
+        print_status("✅ Sample todos.md created")
 
 def create_directories():
     """Create necessary directories"""
     dirs_to_create = ["backups", "tests"]
     
     for dir_name in dirs_to_create:
-        dir_path = Path(dir_name)
-        if not dir_path.exists():
-            dir_path.mkdir(parents=True)
-            print(f"✅ {dir_name}/ directory created")
+        try:
+            Path(dir_name).mkdir(parents=True)
+        except FileExistsError:
+            continue
+        print_status(f"✅ {dir_name}/ directory created")
 
 def organize_test_files():
     """Move test files to tests directory"""
-    test_files = ["test_server.py", "test_frontend.html", "test_e2e.py", "test_summary.py"]
+    test_files = frozenset({"test_server.py", "test_frontend.html", "test_e2e.py", "test_summary.py"})
     tests_dir = Path("tests")
     
-    for test_file in test_files:
-        src = Path(test_file)
-        if src.exists():
-            dst = tests_dir / test_file
-            if not dst.exists():
-                src.rename(dst)
-                print(f"✅ Moved {test_file} to tests/")
+    with os.scandir(".") as entries:
+        movable = [entry.name for entry in entries if entry.name in test_files and entry.is_file()]
+    if not movable:
+        return
+    
+    with os.scandir(tests_dir) as entries:
+        existing = {entry.name for entry in entries}
+    for test_file in movable:
+        if test_file not in existing:
+            os.replace(test_file, tests_dir / test_file)
+            print_status(f"✅ Moved {test_file} to tests/")
 
 def make_scripts_executable():
     """Make shell scripts executable on Unix-like systems"""
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         scripts = ["setup.sh", "run.sh", "test.sh"]
         for script in scripts:
-            if Path(script).exists():
+            try:
                 os.chmod(script, 0o755)
+            except FileNotFoundError:
+                pass
 
 def print_completion_message(venv_path):
     """Print setup completion message"""
+    if not _VERBOSE:
+        return
     print_header("Setup complete!", "🎉")
     
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         activate_cmd = f"venv\\Scripts\\activate"
         run_cmd = "python run.py"
         test_cmd = "python test.py"
@@ -155,10 +186,13 @@ def print_completion_message(venv_path):
 
 def main():
     """Main setup function"""
-    print_header("Setting up Confetti Todo...", "🎉")
+    global _VERBOSE
     
     # Parse arguments
     dev_mode = "--dev" in sys.argv
+    _VERBOSE = "--quiet" not in sys.argv
+    
+    print_header("Setting up Confetti Todo...", "🎉")
     
     # Run setup steps
     check_python_version()
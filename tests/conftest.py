@@ -3,9 +3,19 @@ Pytest configuration and fixtures for Confetti Todo tests
 """
 import pytest
 import os
+import subprocess
+import sys
+import time
+import urllib.request
 from pathlib import Path
-from playwright.sync_api import Page
-from test_utils import TestDataManager, setup_test_data, cleanup_test_data
+from playwright.sync_api import Browser, Page
+from test_utils import (
+    TestDataManager, setup_test_data, cleanup_test_data,
+    WORKER_ID, SERVER_PORT, SERVER_URL, TEST_URL, TEST_TODO_FILE, NO_ANIMATIONS_SCRIPT, load_app,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SERVER_SHUTDOWN_TIMEOUT = 5  # Seconds for uvicorn's shutdown handlers before SIGKILL; bounds a hung server
 
 @pytest.fixture(scope="session")
 def test_mode():
@@ -14,24 +24,102 @@ def test_mode():
     yield
     os.environ.pop("TEST_MODE", None)
     
+def server_ready() -> bool:
+    """Check whether a server is answering on SERVER_URL"""
+    try:
+        urllib.request.urlopen(f"{SERVER_URL}/api/test-mode", timeout=1).close()
+    except OSError:
+        return False
+    return True
+    
+@pytest.fixture(scope="session")
+def app_server():
+    """Start one test-mode server per session (per worker under xdist) for the browser fixtures"""
+    if WORKER_ID is None and server_ready():
+        # Serial run against a server that is already up
+        yield
+        return
+    env = {**os.environ, "TEST_MODE": "true", "TEST_TODO_FILE": str(TEST_TODO_FILE.resolve())}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(SERVER_PORT), "--log-level", "warning"],
+        cwd=PROJECT_ROOT,
+        env=env,
+    )
+    deadline = time.monotonic() + 15
+    while not server_ready():
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            # Fails only the tests that need the server; pytest reuses this error for the rest of the session
+            pytest.fail(f"Test server did not start on port {SERVER_PORT}")
+        time.sleep(0.1)
+    yield
+    process.terminate()
+    try:
+        process.wait(timeout=SERVER_SHUTDOWN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    
+@pytest.fixture(scope="session", autouse=True)
+def test_data_file():
+    """Remove the test data file once the session is done"""
+    yield
+    cleanup_test_data()
+    
 @pytest.fixture(autouse=True)
-def test_data():
-    """Setup and teardown test data for each test"""
-    # Setup
+def test_data(test_data_file):
+    """Reset test data before each test"""
+    # Overwriting the file is enough; the next test rewrites it again
     setup_test_data()
     yield
-    # Teardown
-    cleanup_test_data()
+    
+@pytest.fixture(scope="session")
+def session_page(app_server, browser: Browser, browser_context_args: dict):
+    """Share one browser context and page across all tests using test_page"""
+    context = browser.new_context(**browser_context_args)
+    context.add_init_script(NO_ANIMATIONS_SCRIPT)
+    page = context.new_page()
+    yield page
+    context.close()
     
 @pytest.fixture
-def test_page(page: Page):
+def test_page(session_page: Page):
     """Provide a page that's already in test mode"""
-    # Navigate with test parameter
-    page.goto("http://localhost:8000?test=true")
-    page.wait_for_load_state("networkidle")
+    viewport = session_page.viewport_size
+    load_app(session_page, TEST_URL)
+    yield session_page
+    # Reset persisted UI state and viewport so the next test starts clean
+    session_page.evaluate("localStorage.clear()")
+    if session_page.viewport_size != viewport:
+        session_page.set_viewport_size(viewport)
+    
+@pytest.fixture
+def mobile_page(session_page: Page):
+    """Provide a test-mode page loaded at a mobile viewport, instead of resizing after load"""
+    viewport = session_page.viewport_size
+    session_page.set_viewport_size({"width": 375, "height": 667})
+    load_app(session_page, TEST_URL)
+    yield session_page
+    session_page.evaluate("localStorage.clear()")
+    session_page.set_viewport_size(viewport)
+    
+@pytest.fixture(scope="session")
+def loaded_page(app_server, browser: Browser, browser_context_args: dict):
+    """Provide a page loaded once per session, for tests that only inspect the initial UI"""
+    context = browser.new_context(**browser_context_args)
+    context.add_init_script(NO_ANIMATIONS_SCRIPT)
+    page = context.new_page()
+    load_app(page, TEST_URL)
     yield page
+    context.close()
+    
+@pytest.fixture
+def page(app_server, page: Page):
+    """Disable animations on pytest-playwright's per-test page as well"""
+    page.add_init_script(NO_ANIMATIONS_SCRIPT)
+    return page
     
 @pytest.fixture
 def test_base_url():
     """Provide test mode base URL"""
-    return "http://localhost:8000?test=true"
\ No newline at end of file
+    return TEST_URL
\ No newline at end of file
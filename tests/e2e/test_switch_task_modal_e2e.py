@@ -8,6 +8,7 @@ from playwright.sync_api import Page, expect
 import time
 import re
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import TEST_URL, load_app
 
 
 class TestSwitchTaskModalE2E:
@@ -136,8 +137,7 @@ class TestSwitchTaskModalE2E:
         base.create_task(test_page, task_name)
         
         # Reload page with test mode
-        test_page.goto("http://localhost:8000?test=true")
-        test_page.wait_for_load_state("networkidle")
+        load_app(test_page, TEST_URL)
         
         # Verify app still works
         expect(test_page.locator(".main-content")).to_be_visible()
\ No newline at end of file
@@ -4,8 +4,8 @@ These tests ensure all core functionality works when we make changes
 """
 import pytest
 from playwright.sync_api import Page, expect
-import time
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import ACTIVE_CLASS, TEST_URL, load_app
 
 # CORE FUNCTIONALITY TESTS
 
@@ -37,36 +37,36 @@ def test_search_works(test_page: Page):
     # Use base utility to search
     base.search_for(test_page, "test")
 
-def test_north_star_empty_state(test_page: Page):
+def test_north_star_empty_state(loaded_page: Page):
     """Test that North Star shows empty state"""
     # North Star section should be visible
-    expect(test_page.locator(".north-star-section")).to_be_visible()
+    expect(loaded_page.locator(".north-star-section")).to_be_visible()
     
     # Should show empty state or content
-    north_star_content = test_page.locator(".north-star-section")
+    north_star_content = loaded_page.locator(".north-star-section")
     expect(north_star_content).to_be_visible()
 
-def test_working_zone_empty_state(test_page: Page):
+def test_working_zone_empty_state(loaded_page: Page):
     """Test that working zone shows empty state"""
     # Working zone should exist
-    expect(test_page.locator(".working-zone")).to_be_visible()
+    expect(loaded_page.locator(".working-zone")).to_be_visible()
     
     # Should show empty or working state
-    working_zone = test_page.locator(".working-zone")
+    working_zone = loaded_page.locator(".working-zone")
     expect(working_zone).to_be_visible()
 
-def test_ideas_section_visible(test_page: Page):
+def test_ideas_section_visible(loaded_page: Page):
     """Test that ideas section is visible"""
     # Ideas section should be visible
-    expect(test_page.locator("#ideas-section")).to_be_visible()
+    expect(loaded_page.locator("#ideas-section")).to_be_visible()
 
-def test_filters_work(test_page: Page):
+@pytest.mark.parametrize("filter_name", ["all", "today", "week", "overdue"])
+def test_filters_work(test_page: Page, filter_name: str):
     """Test that task filters work"""
     base = ConfettiTestBase()
     
-    # Test different filters
-    for filter_name in ["all", "today", "week", "overdue"]:
-        base.click_filter(test_page, filter_name)
+    base.click_filter(test_page, filter_name)
+    expect(test_page.locator(f'.date-tab[data-filter="{filter_name}"]')).to_have_class(ACTIVE_CLASS)
 
 def test_keyboard_shortcut_n(test_page: Page):
     """Test that 'N' focuses input"""
@@ -91,8 +91,7 @@ def test_data_persistence(test_page: Page):
     base.create_task(test_page, unique_name)
     
     # Reload with test mode
-    test_page.goto("http://localhost:8000?test=true")
-    test_page.wait_for_load_state("networkidle")
+    load_app(test_page, TEST_URL)
     
     # Verify app still works after reload by creating another task
     after_reload_name = get_unique_task_name()
@@ -9,9 +9,10 @@ import time
 import re
 from datetime import datetime
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import TEST_URL
 
 # Use test mode URL to avoid corrupting production data
-BASE_URL = "http://localhost:8000?test=true"
+BASE_URL = TEST_URL
 
 class TestCoreTaskManagement:
     """Tests for core task management functionality"""
@@ -31,10 +32,7 @@ class TestCoreTaskManagement:
         """Test task completion shows confetti"""
         base = ConfettiTestBase()
         
-        # Create a task first
-        task_name = get_unique_task_name()
-        base.create_task(test_page, task_name)
-        
+        # The seeded test data already has uncompleted tasks
         # Complete the task
         base.complete_first_uncompleted_task(test_page)
         
@@ -50,9 +48,8 @@ class TestCoreTaskManagement:
         """Test subtask functionality exists"""
         base = ConfettiTestBase()
         
-        # Create a parent task first
-        parent_task_name = get_unique_task_name()
-        base.create_task(test_page, parent_task_name)
+        # Use a parent task from the seeded test data
+        parent_task_name = "Test Energy System Task"
         
         # Verify the parent task exists
         base.assert_task_visible(test_page, parent_task_name)
@@ -89,62 +86,43 @@ class TestWorkingZone:
 class TestMobileInterface:
     """Tests specific to mobile interface"""
     
-    def test_mobile_layout_elements(self, test_page: Page):
+    def test_mobile_layout_elements(self, mobile_page: Page):
         """Test mobile-specific UI elements"""
-        base = ConfettiTestBase()
-        
-        # Switch to mobile viewport
-        base.switch_to_mobile(test_page)
-        
         # Mobile nav should be visible
-        mobile_nav = test_page.locator(".mobile-bottom-nav")
+        mobile_nav = mobile_page.locator(".mobile-bottom-nav")
         expect(mobile_nav).to_be_visible()
         
         # Main content should be visible
-        expect(test_page.locator(".main-content")).to_be_visible()
+        expect(mobile_page.locator(".main-content")).to_be_visible()
             
-    def test_mobile_filter_sheet(self, test_page: Page):
+    def test_mobile_filter_sheet(self, mobile_page: Page):
         """Test mobile filter sheet functionality exists"""
-        base = ConfettiTestBase()
-        
-        # Switch to mobile viewport
-        base.switch_to_mobile(test_page)
-        
         # Mobile navigation should be present
-        mobile_nav = test_page.locator(".mobile-bottom-nav, #mobile-more-menu")
+        mobile_nav = mobile_page.locator(".mobile-bottom-nav, #mobile-more-menu")
         
         # If mobile interface elements exist, test passed
         # Otherwise just verify the app works in mobile
-        expect(test_page.locator(".main-content")).to_be_visible()
+        expect(mobile_page.locator(".main-content")).to_be_visible()
         
-    def test_mobile_task_creation(self, test_page: Page):
+    def test_mobile_task_creation(self, mobile_page: Page):
         """Test creating tasks on mobile"""
-        base = ConfettiTestBase()
-        
-        # Switch to mobile viewport
-        base.switch_to_mobile(test_page)
-        
         # Simply verify the mobile layout renders properly
         # Mobile task creation might use different UI elements
-        expect(test_page.locator(".main-content")).to_be_visible()
-        expect(test_page.locator(".mobile-bottom-nav")).to_be_visible()
+        expect(mobile_page.locator(".main-content")).to_be_visible()
+        expect(mobile_page.locator(".mobile-bottom-nav")).to_be_visible()
 
 
 class TestResponsiveDesign:
     """Tests for responsive behavior"""
     
-    def test_viewport_transitions(self, test_page: Page):
-        """Test UI adapts to viewport changes"""
-        base = ConfettiTestBase()
-        
-        # Start desktop
-        base.switch_to_desktop(test_page)
-        expect(test_page.locator(".main-content")).to_be_visible()
-        
-        # Switch to mobile
-        base.switch_to_mobile(test_page)
-        expect(test_page.locator(".main-content")).to_be_visible()
-        expect(test_page.locator(".mobile-bottom-nav")).to_be_visible()
+    def test_desktop_layout(self, loaded_page: Page):
+        """Test UI renders at the default desktop viewport"""
+        expect(loaded_page.locator(".main-content")).to_be_visible()
+        
+    def test_mobile_layout(self, mobile_page: Page):
+        """Test UI renders at a mobile viewport"""
+        expect(mobile_page.locator(".main-content")).to_be_visible()
+        expect(mobile_page.locator(".mobile-bottom-nav")).to_be_visible()
 
 
 class TestUIFeatures:
@@ -8,6 +8,7 @@ import time
 import re
 from datetime import datetime, timedelta
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import TEST_URL, load_app
 
 class TestDesktopCore:
     """Core functionality tests for desktop interface"""
@@ -232,8 +233,7 @@ class TestAdvancedFeatures:
         base.create_task(test_page, task_name)
         
         # Reload and test persistence
-        test_page.goto("http://localhost:8000?test=true")
-        test_page.wait_for_load_state("networkidle")
+        load_app(test_page, TEST_URL)
         expect(test_page.locator(".main-content")).to_be_visible()
     
     def test_performance_with_many_tasks(self, test_page: Page):
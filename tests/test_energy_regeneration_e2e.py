@@ -9,6 +9,7 @@ import time
 from datetime import datetime, timedelta
 import json
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import TEST_URL, load_app
 
 class TestRegenerationDisplay:
     """Test regeneration timer display and visual states"""
@@ -120,8 +121,7 @@ class TestRegenerationIntegration:
         base.create_task(test_page, task_name)
         
         # Reload page
-        test_page.goto("http://localhost:8000?test=true")
-        test_page.wait_for_load_state("networkidle")
+        load_app(test_page, TEST_URL)
         
         # Verify app still works
         expect(test_page.locator(".main-content")).to_be_visible()
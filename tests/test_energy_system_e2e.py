@@ -17,8 +17,9 @@ import time
 import json
 from datetime import datetime, timedelta
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import TEST_URL, reload_app
 
-BASE_URL = "http://localhost:8000?test=true"
+BASE_URL = TEST_URL
 
 class TestEnergySystemDisplay:
     """Test energy display components and visual states"""
@@ -250,8 +251,7 @@ class TestEnergyPersistence:
         base.create_task(test_page, task_name)
         
         # Test refresh behavior
-        test_page.reload()
-        test_page.wait_for_load_state("networkidle")
+        reload_app(test_page)
         expect(test_page.locator(".main-content")).to_be_visible()
     
     def test_daily_energy_reset(self, test_page: Page):
@@ -5,8 +5,9 @@ import pytest
 from playwright.sync_api import Page, expect
 import time
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import TEST_URL
 
-BASE_URL = "http://localhost:8000?test=true"
+BASE_URL = TEST_URL
 
 def test_metadata_order_friction_before_effort(test_page: Page):
     """Test that friction icon appears before effort in task metadata"""
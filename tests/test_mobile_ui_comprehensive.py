@@ -7,8 +7,9 @@ from playwright.sync_api import Page, expect
 import time
 import re
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import TEST_URL
 
-BASE_URL = "http://localhost:8000?test=true"
+BASE_URL = TEST_URL
 MOBILE_WIDTH = 375
 MOBILE_HEIGHT = 667
 DESKTOP_WIDTH = 1280
@@ -4,13 +4,13 @@ Simple test to check overdue date contrast
 import pytest
 from playwright.sync_api import Page, expect
 import time
+from test_utils import SERVER_URL, load_app
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 def test_check_overdue_task_contrast(page: Page):
     """Check contrast of existing overdue tasks"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Look for any overdue tasks
     overdue_tasks = page.locator(".task-item.overdue")
@@ -25,18 +25,10 @@ def test_check_overdue_task_contrast(page: Page):
     print(f"Found overdue task: {first_overdue.locator('.task-title').inner_text()}")
     
     # Find the date span
-    date_spans = first_overdue.locator(".task-meta span")
-    date_span = None
-    
-    for i in range(date_spans.count()):
-        span = date_spans.nth(i)
-        text = span.inner_text()
-        if "📅" in text:
-            date_span = span
-            break
-    
-    if not date_span:
+    date_spans = first_overdue.locator(".task-meta span").filter(has_text="📅")
+    if date_spans.count() == 0:
         pytest.fail("Could not find date span in overdue task")
+    date_span = date_spans.first
     
     # Get computed styles
     styles = date_span.evaluate("""
@@ -6,8 +6,9 @@ from playwright.sync_api import Page, expect
 import time
 from datetime import datetime, timedelta
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import TEST_URL
 
-BASE_URL = "http://localhost:8000?test=true"
+BASE_URL = TEST_URL
 
 def test_overdue_date_contrast(test_page: Page):
     """Test that overdue dates have good contrast against the background"""
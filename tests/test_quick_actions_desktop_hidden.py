@@ -4,15 +4,15 @@ Test that mobile quick action buttons are properly hidden on desktop
 import pytest
 from playwright.sync_api import Page, expect
 import time
+from test_utils import SERVER_URL, load_app, reload_app
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 def test_quick_actions_hidden_on_desktop(page: Page):
     """Test that quick action buttons don't show on desktop"""
     # Set desktop viewport
     page.set_viewport_size({"width": 1280, "height": 800})
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Find task items
     tasks = page.locator(".task-item")
@@ -50,8 +50,7 @@ def test_quick_actions_visible_on_mobile(page: Page):
     """Test that quick action buttons are visible on mobile"""
     # Set mobile viewport
     page.set_viewport_size({"width": 375, "height": 667})
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Find non-completed tasks
     tasks = page.locator(".task-item:not(.completed)")
@@ -79,8 +78,7 @@ def test_quick_actions_visible_on_mobile(page: Page):
 
 def test_responsive_quick_actions(page: Page):
     """Test that quick actions respond correctly to viewport changes"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     tasks = page.locator(".task-item:not(.completed)")
     if tasks.count() == 0:
@@ -104,8 +102,7 @@ def test_responsive_quick_actions(page: Page):
     
     # Quick actions should now be visible
     # Note: The page might need to be reloaded for JS to detect the change
-    page.reload()
-    page.wait_for_load_state("networkidle")
+    reload_app(page)
     
     quick_actions = page.locator(".task-item:not(.completed)").first.locator(".task-quick-actions")
     expect(quick_actions).to_be_visible()
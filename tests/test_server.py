@@ -0,0 +1,154 @@
+"""
+Unit tests for server internals: regeneration scheduling, derived caches and WebSocket outboxes
+"""
+import asyncio
+import copy
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import pytest
+import server
+
+@pytest.fixture
+def regeneration_queue(monkeypatch):
+    """Give each test an empty regeneration heap and no sessions"""
+    monkeypatch.setattr(server, "regeneration_heap", [])
+    monkeypatch.setattr(server, "regeneration_due", {})
+    monkeypatch.setattr(server, "regeneration_wakeup", None)
+    monkeypatch.setattr(server, "energy_storage", OrderedDict())
+
+@pytest.fixture
+def todo_file(tmp_path, monkeypatch):
+    """Point the server at an empty todo file with cold caches"""
+    path = tmp_path / "todos.md"
+    monkeypatch.setattr(server, "TODO_FILE", path)
+    monkeypatch.setattr(server, "BACKUP_DIR", tmp_path / "backups")
+    monkeypatch.setattr(server, "_last_written_mtime_ns", None)
+    monkeypatch.setattr(server, "_parse_cache", (None, {}))
+    monkeypatch.setattr(server, "_stats_cache", (None, {}))
+    monkeypatch.setattr(server, "_quick_win_cache", (None, None))
+    return path
+
+class StuckWebSocket:
+    """A client that stopped reading: sends never complete"""
+    def __init__(self):
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        await asyncio.Event().wait()
+
+    async def close(self):
+        self.closed = True
+
+# REGENERATION SCHEDULING
+
+def test_schedule_regeneration_queues_next_due_time(regeneration_queue):
+    """A regenerating session is queued one interval after its last regeneration"""
+    state = server.EnergyState(session_id="a", current_energy=5)
+    server.schedule_regeneration(state)
+
+    due = state.last_regeneration_time + timedelta(seconds=server.REGENERATION_INTERVAL)
+    assert server.regeneration_heap == [(due, "a")]
+    assert server.regeneration_due == {"a": due}
+
+def test_schedule_regeneration_skips_idle_sessions(regeneration_queue):
+    """Full, paused and on-break sessions are not queued"""
+    server.schedule_regeneration(server.EnergyState(session_id="full"))
+    server.schedule_regeneration(server.EnergyState(session_id="paused", current_energy=5, regeneration_paused_at=datetime.now()))
+    server.schedule_regeneration(server.EnergyState(session_id="break", current_energy=5, is_on_break=True))
+
+    assert server.regeneration_heap == []
+
+def test_schedule_regeneration_is_idempotent(regeneration_queue):
+    """Scheduling the same due time twice queues it once"""
+    state = server.EnergyState(session_id="a", current_energy=5)
+    server.schedule_regeneration(state)
+    server.schedule_regeneration(state)
+
+    assert len(server.regeneration_heap) == 1
+
+def test_rescheduling_supersedes_earlier_entry(regeneration_queue):
+    """A new due time replaces the old one; the stale heap entry is left to be skipped"""
+    state = server.EnergyState(session_id="a", current_energy=5)
+    server.schedule_regeneration(state)
+    state.last_regeneration_time += timedelta(minutes=5)
+    server.schedule_regeneration(state)
+
+    due = state.last_regeneration_time + timedelta(seconds=server.REGENERATION_INTERVAL)
+    assert len(server.regeneration_heap) == 2
+    assert server.regeneration_due["a"] == due
+
+async def test_regeneration_task_regenerates_due_session(regeneration_queue, monkeypatch):
+    """The background task wakes for a due session, adds energy and queues the next interval"""
+    broadcasts = []
+    broadcast_sent = asyncio.Event()
+
+    async def record_broadcast(message: dict):
+        broadcasts.append(message)
+        broadcast_sent.set()
+
+    monkeypatch.setattr(server.manager, "broadcast", record_broadcast)
+    state = server.EnergyState(session_id="a", current_energy=5)
+    state.last_regeneration_time = datetime.now() - timedelta(seconds=server.REGENERATION_INTERVAL + 1)
+    server.energy_storage["a"] = state
+
+    task = asyncio.create_task(server.regeneration_task())
+    try:
+        await asyncio.wait_for(broadcast_sent.wait(), timeout=1)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert state.current_energy == 6
+    assert broadcasts[0]["type"] == "energy_regenerated"
+    assert server.regeneration_due["a"] == state.last_regeneration_time + timedelta(seconds=server.REGENERATION_INTERVAL)
+
+# DERIVED CACHES
+
+def test_save_invalidates_stats_and_quick_win_on_same_mtime_and_size(todo_file):
+    """A save that keeps the file's size and mtime still refreshes stats and the quick win"""
+    todo_file.write_text("# today\n- [ ] Quick fix !5m\n\n# ideas\n\n# backlog\n")
+    original = todo_file.stat()
+
+    assert server.get_cached_stats()["total_xp"] == 0
+    assert server.get_cached_quick_win()["title"] == "Quick fix"
+
+    # The parsed tree is shared with the cache, so mutate a copy
+    sections = copy.deepcopy(server.parse_markdown())
+    sections["today"][0]["is_completed"] = True
+    server.save_markdown(sections)
+    os.utime(todo_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+    assert todo_file.stat().st_size == original.st_size
+
+    assert server.get_cached_stats()["total_xp"] > 0
+    assert server.get_cached_quick_win() is None
+
+def test_parse_cache_reused_while_file_unchanged(todo_file):
+    """Unchanged files are served from the cache without reparsing"""
+    todo_file.write_text("# today\n- [ ] Quick fix !5m\n\n# ideas\n\n# backlog\n")
+
+    assert server.parse_markdown() is server.parse_markdown()
+
+# WEBSOCKET OUTBOXES
+
+async def test_overflowed_client_is_dropped_and_closed():
+    """A client whose outbox overflows loses its relay and is closed, even mid-send"""
+    manager = server.ConnectionManager()
+    websocket = StuckWebSocket()
+    await manager.connect(websocket)
+    relay_task = manager.relay_tasks[websocket]
+
+    # Let the relay pick up the first message and block in send_text
+    await manager.broadcast({"type": "ping"})
+    await asyncio.sleep(0)
+    for _ in range(server.OUTBOX_MAX_SIZE + 1):
+        await manager.broadcast({"type": "ping"})
+    await asyncio.gather(relay_task, *list(manager.close_tasks), return_exceptions=True)
+
+    assert relay_task.cancelled()
+    assert websocket.closed
+    assert websocket not in manager.active_connections
+    assert websocket not in manager.outboxes
@@ -4,6 +4,7 @@ import pytest
 from playwright.sync_api import Page, expect
 import time
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import SERVER_URL, load_app
 
 
 def test_mini_checkboxes_display(test_page: Page):
@@ -104,8 +105,7 @@ def test_mini_checkbox_hover_effects(test_page: Page):
 
 def test_progress_bar_removed(page: Page):
     """Verify old progress bar elements are completely removed"""
-    page.goto("http://localhost:8000")
-    page.wait_for_load_state("networkidle")
+    load_app(page, SERVER_URL)
     
     # Check that no old progress bar elements exist
     old_progress = page.locator(".task-progress")
@@ -119,8 +119,7 @@ def test_progress_bar_removed(page: Page):
 
 def test_empty_task_no_checkboxes(page: Page):
     """Test that tasks without subtasks don't show checkboxes"""
-    page.goto("http://localhost:8000")
-    page.wait_for_load_state("networkidle")
+    load_app(page, SERVER_URL)
     
     # Create a task without subtasks
     page.keyboard.press("n")
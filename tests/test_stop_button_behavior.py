@@ -4,13 +4,13 @@ Test stop button behavior to identify the double-click issue
 import pytest
 from playwright.sync_api import Page, expect
 import time
+from test_utils import SERVER_URL, load_app
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 def test_stop_button_behavior_detailed(page: Page):
     """Detailed test of stop button behavior"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Find a task to start
     tasks = page.locator(".task-item:not(.completed)")
@@ -104,8 +104,7 @@ def test_stop_button_behavior_detailed(page: Page):
 
 def test_stop_button_event_handlers(page: Page):
     """Check if there are multiple event handlers causing issues"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Start a task
     tasks = page.locator(".task-item:not(.completed)")
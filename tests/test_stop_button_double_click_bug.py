@@ -4,13 +4,13 @@ Test for stop button requiring double click - this is a bug
 import pytest
 from playwright.sync_api import Page, expect
 import time
+from test_utils import SERVER_URL, load_app
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 def test_stop_button_single_click(page: Page):
     """Test that stop button works with a single click"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Find a task to start
     tasks = page.locator(".task-item:not(.completed)")
@@ -48,8 +48,7 @@ def test_stop_button_single_click(page: Page):
 def test_stop_button_on_mobile(page: Page):
     """Test that stop button works with single click on mobile too"""
     page.set_viewport_size({"width": 375, "height": 667})
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Find and start a task
     tasks = page.locator(".task-item:not(.completed)")
@@ -77,8 +76,7 @@ def test_stop_button_on_mobile(page: Page):
 
 def test_stop_button_click_count(page: Page):
     """Test that stop button doesn't require multiple clicks"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     tasks = page.locator(".task-item:not(.completed)")
     if tasks.count() == 0:
@@ -4,13 +4,13 @@ Test stop button in real user scenario where double-click is needed
 import pytest
 from playwright.sync_api import Page, expect
 import time
+from test_utils import SERVER_URL, load_app
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 def test_stop_button_manual_simulation(page: Page):
     """Simulate exact user behavior when stop button requires double click"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Find and start a task
     tasks = page.locator(".task-item:not(.completed)")
@@ -68,8 +68,7 @@ def test_stop_button_manual_simulation(page: Page):
 
 def test_check_event_bubbling_issue(page: Page):
     """Check if event bubbling might be causing the issue"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     tasks = page.locator(".task-item:not(.completed)")
     if tasks.count() == 0:
@@ -152,8 +151,7 @@ def test_check_event_bubbling_issue(page: Page):
 
 def test_stop_button_css_pointer_events(page: Page):
     """Check if CSS pointer-events might be interfering"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     tasks = page.locator(".task-item:not(.completed)")
     if tasks.count() == 0:
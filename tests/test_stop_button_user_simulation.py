@@ -4,13 +4,13 @@ Test stop button with exact user simulation to find the double-click bug
 import pytest
 from playwright.sync_api import Page, expect
 import time
+from test_utils import SERVER_URL, load_app
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 def test_stop_button_rapid_clicks(page: Page):
     """Test what happens with rapid/multiple clicks on stop button"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # Start a task
     tasks = page.locator(".task-item:not(.completed)")
@@ -88,8 +88,7 @@ def test_stop_button_rapid_clicks(page: Page):
 
 def test_stop_button_with_delay(page: Page):
     """Test if there's a timing issue with stop button"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     tasks = page.locator(".task-item:not(.completed)")
     if tasks.count() == 0:
@@ -132,8 +131,7 @@ def test_stop_button_with_delay(page: Page):
 
 def test_stop_button_focus_blur(page: Page):
     """Test if focus/blur events affect stop button"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     tasks = page.locator(".task-item:not(.completed)")
     if tasks.count() == 0:
@@ -170,8 +168,7 @@ def test_stop_button_focus_blur(page: Page):
 
 def test_stop_button_prevents_default(page: Page):
     """Check if preventDefault is being called somewhere"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     tasks = page.locator(".task-item:not(.completed)")
     if tasks.count() == 0:
@@ -5,8 +5,9 @@ import pytest
 from playwright.sync_api import Page, expect
 import time
 import re
+from test_utils import SERVER_URL
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 def test_subtask_remains_expanded_after_add(test_page: Page):
     """Test that accordion stays open after adding a subtask"""
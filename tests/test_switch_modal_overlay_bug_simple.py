@@ -4,14 +4,13 @@ Testing that the grey overlay is properly removed after modal actions
 """
 import pytest
 from playwright.sync_api import Page, expect
-import time
+from test_utils import SERVER_URL, load_app, wait_for_task
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 def test_overlay_removed_after_modal_action(page: Page):
     """Test that grey overlay is removed when modal is closed"""
-    page.goto(BASE_URL)
-    page.wait_for_load_state("networkidle")
+    load_app(page, BASE_URL)
     
     # First, let's check if there are existing tasks we can use
     tasks = page.locator(".task-item")
@@ -29,19 +28,19 @@ def test_overlay_removed_after_modal_action(page: Page):
         page.locator("#task-input").click()
         page.locator("#task-input").fill("Test Task 1")
         page.locator("#task-input").press("Enter")
-        time.sleep(0.5)
+        expect(page.locator("#palette-modal")).to_be_visible()
         # Press Enter to accept default type
         page.keyboard.press("Enter")
-        time.sleep(1)
+        wait_for_task(page, "Test Task 1")
         
         # Add second task
         page.locator("#task-input").click()
         page.locator("#task-input").fill("Test Task 2")
         page.locator("#task-input").press("Enter")
-        time.sleep(0.5)
+        expect(page.locator("#palette-modal")).to_be_visible()
         # Press Enter to accept default type
         page.keyboard.press("Enter")
-        time.sleep(1)
+        wait_for_task(page, "Test Task 2")
         
         # Now find the tasks
         tasks = page.locator(".task-item")
@@ -55,7 +54,6 @@ def test_overlay_removed_after_modal_action(page: Page):
         # Try alternative selector
         work_btn = first_task.locator("button:has-text('▶')")
     work_btn.click()
-    time.sleep(0.5)
     
     # Verify working zone shows the task
     working_zone = page.locator(".working-zone")
@@ -67,11 +65,11 @@ def test_overlay_removed_after_modal_action(page: Page):
     if work_btn2.count() == 0:
         work_btn2 = second_task.locator("button:has-text('▶')")
     work_btn2.click()
-    time.sleep(0.5)
     
     # Verify modal and overlay are visible
     modal = page.locator(".switch-modal")
     overlay = page.locator(".modal-overlay")
+    modal.wait_for()
     
     print(f"Modal visible: {modal.is_visible()}")
     print(f"Overlay count: {overlay.count()}")
@@ -92,7 +90,6 @@ def test_overlay_removed_after_modal_action(page: Page):
     print("Clicking Keep Working button...")
     keep_button = page.locator("button.keep-working")
     keep_button.click()
-    time.sleep(0.5)
     
     # Modal should be hidden
     expect(modal).to_be_hidden()
@@ -3,17 +3,16 @@ Test for switch modal overlay bug - comprehensive tests after fix
 """
 import pytest
 from playwright.sync_api import Page, expect
-import time
+from test_utils import SERVER_URL, load_app
 
-BASE_URL = "http://localhost:8000"
+BASE_URL = SERVER_URL
 
 class TestSwitchModalOverlayFixed:
     """Test that modal overlay is properly removed after user action"""
     
     def test_overlay_removed_after_keep_working(self, page: Page):
         """Test that grey overlay is removed when clicking 'Keep Working'"""
-        page.goto(BASE_URL)
-        page.wait_for_load_state("networkidle")
+        load_app(page, BASE_URL)
         
         # Use existing tasks
         tasks = page.locator(".task-item")
@@ -25,11 +24,9 @@ class TestSwitchModalOverlayFixed:
         
         # Start the first task
         first_task.locator(".work-btn").click()
-        time.sleep(0.5)
         
         # Try to start the second task
         second_task.locator(".work-btn").click()
-        time.sleep(0.5)
         
         # Verify modal and overlay are visible
         modal = page.locator(".switch-modal")
@@ -46,7 +43,6 @@ class TestSwitchModalOverlayFixed:
         
         # Click "Keep Working"
         page.locator("button.keep-working").click()
-        time.sleep(0.5)
         
         # Modal should be hidden
         expect(modal).to_be_hidden()
@@ -63,8 +59,7 @@ class TestSwitchModalOverlayFixed:
         
     def test_overlay_removed_after_switch_task(self, page: Page):
         """Test that grey overlay is removed when clicking 'Switch Task'"""
-        page.goto(BASE_URL)
-        page.wait_for_load_state("networkidle")
+        load_app(page, BASE_URL)
         
         tasks = page.locator(".task-item")
         if tasks.count() < 2:
@@ -75,15 +70,12 @@ class TestSwitchModalOverlayFixed:
         
         # Start first task
         first_task.locator(".work-btn").click()
-        time.sleep(0.5)
         
         # Try to start second task
         second_task.locator(".work-btn").click()
-        time.sleep(0.5)
         
         # Click "Switch Task"
         page.locator("button.switch-task").click()
-        time.sleep(0.5)
         
         # Modal and overlays should be hidden
         modal = page.locator(".switch-modal")
@@ -98,8 +90,7 @@ class TestSwitchModalOverlayFixed:
     def test_overlay_removed_on_mobile(self, page: Page):
         """Test that overlay is properly removed on mobile too"""
         page.set_viewport_size({"width": 375, "height": 667})
-        page.goto(BASE_URL)
-        page.wait_for_load_state("networkidle")
+        load_app(page, BASE_URL)
         
         tasks = page.locator(".task-item")
         if tasks.count() < 2:
@@ -112,7 +103,6 @@ class TestSwitchModalOverlayFixed:
             first_quick.click()
         else:
             first_task.locator(".work-btn").click()
-        time.sleep(0.5)
         
         # Try to start second task
         second_task = tasks.nth(1)
@@ -121,11 +111,10 @@ class TestSwitchModalOverlayFixed:
             second_quick.click()
         else:
             second_task.locator(".work-btn").click()
-        time.sleep(0.5)
         
         # Click keep working
         page.locator("button.keep-working").click()
-        time.sleep(0.5)
+        expect(page.locator(".switch-modal")).to_be_hidden()
         
         # Verify overlays are hidden
         overlays = page.locator(".modal-overlay")
@@ -136,15 +125,13 @@ class TestSwitchModalOverlayFixed:
         
         # Verify mobile UI is still interactive
         page.locator("#mobile-add-task").click()
-        time.sleep(0.3)
         mobile_input = page.locator("input.mobile-task-input")
         expect(mobile_input).to_be_visible()
         mobile_input.press("Escape")
         
     def test_no_duplicate_overlays(self, page: Page):
         """Test that repeated modal shows don't create duplicate overlays"""
-        page.goto(BASE_URL)
-        page.wait_for_load_state("networkidle")
+        load_app(page, BASE_URL)
         
         tasks = page.locator(".task-item")
         if tasks.count() < 2:
@@ -152,22 +139,18 @@ class TestSwitchModalOverlayFixed:
         
         # Start first task
         tasks.first.locator(".work-btn").click()
-        time.sleep(0.5)
         
         # Show and dismiss modal multiple times
+        modal = page.locator(".switch-modal")
         for _ in range(3):
             tasks.nth(1).locator(".work-btn").click()
-            time.sleep(0.3)
+            expect(modal).to_be_visible()
             page.locator("button.keep-working").click()
-            time.sleep(0.3)
+            expect(modal).to_be_hidden()
         
         # Count total overlays - should only have the palette one
-        overlays = page.locator(".modal-overlay")
-        non_palette_overlays = []
-        for i in range(overlays.count()):
-            overlay = overlays.nth(i)
-            if overlay.get_attribute("id") != "modal-overlay":
-                non_palette_overlays.append(i)
+        overlay_ids = page.locator(".modal-overlay").evaluate_all("els => els.map(e => e.id)")
+        non_palette_overlays = [overlay_id for overlay_id in overlay_ids if overlay_id != "modal-overlay"]
         
         assert len(non_palette_overlays) == 0, f"Found {len(non_palette_overlays)} non-palette overlays, expected 0"
 
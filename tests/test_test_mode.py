@@ -5,6 +5,7 @@ import pytest
 from playwright.sync_api import Page, expect
 from pathlib import Path
 from base_test import ConfettiTestBase, get_unique_task_name
+from test_utils import SERVER_URL
 
 def test_test_mode_uses_separate_file(test_page: Page):
     """Verify test mode uses todos.test.md not todos.md"""
@@ -12,7 +13,7 @@ def test_test_mode_uses_separate_file(test_page: Page):
     
     # Check via API that we're in test mode (if endpoint exists)
     try:
-        response = page.request.get("http://localhost:8000/api/test-mode")
+        response = page.request.get(f"{SERVER_URL}/api/test-mode")
         data = response.json()
         
         assert data["test_mode"] == True
@@ -3,12 +3,24 @@ Test utilities for Confetti Todo tests
 Provides setup/teardown for test data to avoid corrupting production data
 """
 import os
+import re
 from pathlib import Path
 import shutil
-from playwright.sync_api import Page
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from playwright.sync_api import Frame, Page, Request, Response
+
+# Under pytest-xdist every worker runs its own server and data file
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER")
+SERVER_PORT = 8001 + int(WORKER_ID[2:]) if WORKER_ID else 8000
+SERVER_URL = f"http://localhost:{SERVER_PORT}"
+TEST_URL = f"{SERVER_URL}?test=true"
+
+# Class pattern for the selected filter tab
+ACTIVE_CLASS = re.compile(r"\bactive\b")
 
 # Test data file
-TEST_TODO_FILE = Path("todos.test.md")
+TEST_TODO_FILE = Path(f"{WORKER_ID}.todos.test.md") if WORKER_ID else Path("todos.test.md")
 PROD_TODO_FILE = Path("todos.md")
 
 # Sample test data
@@ -30,27 +42,85 @@ TEST_DATA = """# today
 - [ ] Another Backlog Item @support !30m %1
 - [x] Completed Energy Task @admin !1h %2 {2025-07-29}
 """
+_TEST_DATA_BYTES = TEST_DATA.encode()
+
+# Init script that zeroes CSS animations and transitions so visibility waits resolve at once
+NO_ANIMATIONS_SCRIPT = """
+addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = '*, *::before, *::after { animation-duration: 0s !important; animation-delay: 0s !important; transition-duration: 0s !important; transition-delay: 0s !important; }';
+    document.head.appendChild(style);
+});
+"""
 
 def setup_test_data():
     """Create test data file with sample tasks"""
-    TEST_TODO_FILE.write_text(TEST_DATA)
+    TEST_TODO_FILE.write_bytes(_TEST_DATA_BYTES)
     
 def cleanup_test_data():
     """Remove test data file"""
-    if TEST_TODO_FILE.exists():
-        TEST_TODO_FILE.unlink()
+    TEST_TODO_FILE.unlink(missing_ok=True)
         
+def is_stats_request(request: Request) -> bool:
+    """Match the stats request loadTodos makes after rendering the tasks"""
+    return urlparse(request.url).path == "/api/stats" and request.method == "GET"
+    
+@contextmanager
+def expect_app_rendered(page: Page):
+    """Wait, on exit, for the stats response of the document the block navigates to"""
+    # A shared page can still be refetching stats for the old document, so only
+    # requests made after the new document commits count
+    committed = []
+    own_requests = []
+    
+    def on_frame_navigated(frame: Frame):
+        if frame == page.main_frame:
+            committed.append(frame)
+            
+    def on_request(request: Request):
+        if committed and is_stats_request(request):
+            own_requests.append(request)
+            
+    page.on("framenavigated", on_frame_navigated)
+    page.on("request", on_request)
+    try:
+        with page.expect_response(lambda response: response.request in own_requests):
+            yield
+    finally:
+        page.remove_listener("framenavigated", on_frame_navigated)
+        page.remove_listener("request", on_request)
+        
+def load_app(page: Page, url: str):
+    """Navigate to the app and return once the initial data has rendered"""
+    with expect_app_rendered(page):
+        page.goto(url, wait_until="domcontentloaded")
+        
+def reload_app(page: Page):
+    """Reload the app and return once the initial data has rendered"""
+    with expect_app_rendered(page):
+        page.reload(wait_until="domcontentloaded")
+        
+def wait_for_task(page: Page, title: str):
+    """Wait for a task with the given title to render, checking every animation frame"""
+    page.wait_for_function(
+        "title => [...document.querySelectorAll('.task-item .task-title')].some(node => node.textContent.includes(title))",
+        arg=title,
+        polling="raf",
+    )
+    
 def ensure_test_mode(page: Page) -> str:
     """Ensure the page is using test mode"""
     # Navigate with test mode parameter
-    base_url = "http://localhost:8000"
-    page.goto(f"{base_url}?test=true")
-    page.wait_for_load_state("networkidle")
-    return base_url
+    load_app(page, TEST_URL)
+    return SERVER_URL
+    
+def is_save_response(response: Response) -> bool:
+    """Match the POST that persists todos, for use with page.expect_response"""
+    return response.url.endswith("/api/todos") and response.request.method == "POST"
     
 def get_test_base_url() -> str:
     """Get base URL with test mode"""
-    return "http://localhost:8000?test=true"
+    return TEST_URL
     
 class TestDataManager:
     """Context manager for test data"""